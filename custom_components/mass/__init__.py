@@ -106,9 +106,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             raise ConfigEntryNotReady(listen_error) from listen_error
 
     # register listener for removed players
+    dev_reg = dr.async_get(hass)
+
     async def handle_player_removed(event: MassEvent) -> None:
         """Handle Mass Player Removed event."""
-        dev_reg = dr.async_get(hass)
         if hass_device := dev_reg.async_get_device({(DOMAIN, event.object_id)}):
             dev_reg.async_remove_device(hass_device.id)
 
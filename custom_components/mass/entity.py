@@ -4,14 +4,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.helpers.entity import DeviceInfo, Entity, EntityDescription
 from music_assistant.common.models.enums import EventType
-from music_assistant.common.models.event import MassEvent
 
 from .const import DOMAIN
 
 if TYPE_CHECKING:
     from music_assistant.client import MusicAssistantClient
+    from music_assistant.common.models.event import MassEvent
     from music_assistant.common.models.player import Player
 
 
@@ -20,17 +20,31 @@ class MassBaseEntity(Entity):
 
     _attr_has_entity_name = True
 
-    def __init__(self, mass: MusicAssistantClient, player_id: str) -> None:
+    def __init__(
+        self,
+        mass: MusicAssistantClient,
+        player_id: str,
+        entity_description: EntityDescription | None = None,
+    ) -> None:
         """Initialize MediaPlayer entity."""
         self.mass = mass
         self.player_id = player_id
         self._attr_should_poll = False
+        self._attr_unique_id = f"mass_{player_id}"
+        # the unique_id is set once here, so the entity description must be
+        # passed in (instead of assigned after init) to be part of it
+        if entity_description is not None:
+            self.entity_description = entity_description
+            self._attr_unique_id += f"_{entity_description.key}"
         player = mass.players.get(player_id)
-        provider = self.mass.get_provider(player.provider)
+        device_info = player.device_info
+        manufacturer = device_info.manufacturer
+        if not manufacturer and (provider := mass.get_provider(player.provider)):
+            manufacturer = provider.name
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, player_id)},
-            manufacturer=player.device_info.manufacturer or provider.name,
-            model=player.device_info.model or player.name,
+            manufacturer=manufacturer,
+            model=device_info.model or player.name,
             name=player.display_name,
             configuration_url=f"{mass.server_url}/#/settings/editplayer/{player_id}",
         )
@@ -57,23 +71,19 @@ class MassBaseEntity(Entity):
         assert player is not None
         return player
 
-    @property
-    def unique_id(self) -> str | None:
-        """Return unique id for entity."""
-        _base = f"mass_{self.player_id}"
-        if hasattr(self, "entity_description"):
-            return f"{_base}_{self.entity_description.key}"
-        return _base
-
     @property
     def available(self) -> bool:
         """Return availability of entity."""
-        return self.player.available and self.mass.connection.connected
+        return self._is_player_available(self.player)
+
+    def _is_player_available(self, player: Player) -> bool:
+        """Return if the given (already resolved) player is available."""
+        return player.available and self.mass.connection.connected
 
     async def __on_mass_update(self, event: MassEvent) -> None:
         """Call when we receive an event from MusicAssistant."""
         if (
-            event == EventType.QUEUE_UPDATED
+            event.event == EventType.QUEUE_UPDATED
             and event.object_id != self.player.active_source
         ):
             return
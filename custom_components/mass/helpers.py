@@ -27,11 +27,11 @@ def get_mass(
     hass: HomeAssistant, entry_id: str | None = None
 ) -> MusicAssistantClient | None:
     """Return MusicAssistantClient instance."""
-    if DOMAIN not in hass.data:
+    if not (entries := hass.data.get(DOMAIN)):
         return None
-    for key, value in hass.data[DOMAIN].items():
-        if entry_id is not None and entry_id != key:
-            continue
-        mass_entry_data: MassEntryData = value
-        return mass_entry_data.mass
-    return None
+    mass_entry_data: MassEntryData | None
+    if entry_id is None:
+        mass_entry_data = next(iter(entries.values()))
+    else:
+        mass_entry_data = entries.get(entry_id)
+    return mass_entry_data.mass if mass_entry_data else None
@@ -11,6 +11,7 @@ from homeassistant.components.conversation import (
     SERVICE_PROCESS as CONVERSATION_SERVICE,
 )
 from homeassistant.components.conversation.const import DOMAIN as CONVERSATION_DOMAIN
+from homeassistant.components.media_player.const import DOMAIN as MEDIA_PLAYER_DOMAIN
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import config_validation as cv
@@ -18,7 +19,7 @@ from homeassistant.helpers import intent
 from music_assistant.common.models.errors import MusicAssistantError
 
 from . import DOMAIN
-from .const import CONF_OPENAI_AGENT_ID
+from .const import ATTR_MASS_PLAYER_ID, CONF_OPENAI_AGENT_ID
 from .media_player import ATTR_MEDIA_ID, ATTR_MEDIA_TYPE, ATTR_RADIO_MODE, MassPlayer
 
 INTENT_PLAY_MEDIA_ON_MEDIA_PLAYER = "MassPlayMediaOnMediaPlayer"
@@ -134,13 +135,14 @@ class MassPlayMediaOnMediaPlayerHandler(intent.IntentHandler):
     async def _async_query_ai(
         self, intent_obj: intent.Intent, query: str, config_entry: ConfigEntry
     ) -> str:
-        service_data: dict[str, Any] = {}
-        service_data[ATTR_AGENT_ID] = config_entry.data.get(CONF_OPENAI_AGENT_ID)
-        service_data[ATTR_TEXT] = query
+        service_data: dict[str, Any] = {
+            ATTR_AGENT_ID: config_entry.data.get(CONF_OPENAI_AGENT_ID),
+            ATTR_TEXT: query,
+        }
         ai_response = await intent_obj.hass.services.async_call(
             CONVERSATION_DOMAIN,
             CONVERSATION_SERVICE,
-            {**service_data},
+            service_data,
             blocking=True,
             context=intent_obj.context,
             return_response=True,
@@ -158,11 +160,11 @@ class MassPlayMediaOnMediaPlayerHandler(intent.IntentHandler):
     async def _get_matched_state(
         self, intent_obj: intent.Intent, name: str | None, area_name: str | None
     ) -> State:
-        mass_states: set[str] = set()
-        initial_states = intent_obj.hass.states.async_all()
-        for state in initial_states:
-            if state.attributes.get("mass_player_id") is not None:
-                mass_states.add(state)
+        mass_states: list[State] = [
+            state
+            for state in intent_obj.hass.states.async_all(MEDIA_PLAYER_DOMAIN)
+            if state.attributes.get(ATTR_MASS_PLAYER_ID) is not None
+        ]
 
         states = list(
             intent.async_match_states(
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components import media_source
 from homeassistant.components.media_player import BrowseError, BrowseMedia
@@ -20,23 +21,15 @@ from homeassistant.components.media_player.const import (
     MediaClass,
     MediaType,
 )
-from homeassistant.core import HomeAssistant, callback
-from music_assistant.common.models.media_items import MediaItemType
+from homeassistant.core import HomeAssistant
 
 from .const import DEFAULT_NAME, DOMAIN
 
 if TYPE_CHECKING:
-    from music_assistant.client import MusicAssistantClient
-
-MEDIA_TYPE_RADIO = "radio"
+    from collections.abc import Awaitable, Callable, Sequence
 
-PLAYABLE_MEDIA_TYPES = [
-    MEDIA_TYPE_PLAYLIST,
-    MEDIA_TYPE_ALBUM,
-    MEDIA_TYPE_ARTIST,
-    MEDIA_TYPE_RADIO,
-    MEDIA_TYPE_TRACK,
-]
+    from music_assistant.client import MusicAssistantClient
+    from music_assistant.common.models.media_items import MediaItemType
 
 LIBRARY_ARTISTS = "artists"
 LIBRARY_ALBUMS = "albums"
@@ -62,8 +55,40 @@ LIBRARY_MEDIA_CLASS_MAP = {
     LIBRARY_RADIO: MEDIA_CLASS_MUSIC,  # radio is not accepted by HA
 }
 
-MEDIA_CONTENT_TYPE_FLAC = "audio/flac"
-THUMB_SIZE = 200
+# library: (media content type, can expand items)
+LIBRARY_CONTENT_MAP = {
+    LIBRARY_ARTISTS: (MEDIA_TYPE_ARTIST, True),
+    LIBRARY_ALBUMS: (MEDIA_TYPE_ALBUM, True),
+    LIBRARY_TRACKS: (MEDIA_TYPE_TRACK, False),
+    LIBRARY_PLAYLISTS: (MEDIA_TYPE_PLAYLIST, True),
+    LIBRARY_RADIO: (DOMAIN, False),
+}
+
+
+def split_uri(uri: str) -> tuple[str, str, str]:
+    """Split a provider://media_type/item_id uri into its parts."""
+    provider, _, path = uri.partition("://")
+    media_type, _, item_id = path.partition("/")
+    return provider, media_type, item_id
+
+
+async def get_item_with_children(
+    mass: MusicAssistantClient,
+    identifier: str,
+    get_children: Callable[[str, str], Awaitable[list[Any]]],
+) -> tuple[MediaItemType, list[Any]]:
+    """Return the media item for a uri together with its children."""
+    provider, _, item_id = split_uri(identifier)
+    if provider != "library":
+        # the server resolves a provider uri to the matching library item
+        # (if any), so the children must be requested with the ids of the
+        # item it returned or we could list a different set of children
+        item = await mass.music.get_item_by_uri(identifier)
+        return item, await get_children(item.item_id, item.provider)
+    # a library uri already holds the ids of the item, fetch both at once
+    return await asyncio.gather(
+        mass.music.get_item_by_uri(identifier), get_children(item_id, provider)
+    )
 
 
 def media_source_filter(item: BrowseMedia) -> bool:
@@ -78,32 +103,19 @@ async def async_browse_media(
     media_content_type: str | None,
 ) -> BrowseMedia:
     """Browse media."""
-    # pylint: disable=too-many-return-statements
     if media_content_id is None:
         return await build_main_listing(hass)
 
     assert media_content_type is not None
-    if media_content_id == LIBRARY_ARTISTS:
-        return await build_artists_listing(mass)
-    if media_content_id == LIBRARY_ALBUMS:
-        return await build_albums_listing(mass)
-    if media_content_id == LIBRARY_TRACKS:
-        return await build_tracks_listing(mass)
-    if media_content_id == LIBRARY_PLAYLISTS:
-        return await build_playlists_listing(mass)
-    if media_content_id == LIBRARY_RADIO:
-        return await build_radio_listing(mass)
-    if "artist" in media_content_id:
-        return await build_artist_items_listing(mass, media_content_id)
-    if "album" in media_content_id:
-        return await build_album_items_listing(mass, media_content_id)
-    if "playlist" in media_content_id:
-        return await build_playlist_items_listing(mass, media_content_id)
+    if media_content_id in LIBRARY_CONTENT_MAP:
+        return await build_library_listing(mass, media_content_id)
+    _, media_type, _ = split_uri(media_content_id)
+    if item_builder := ITEM_LISTING_BUILDERS.get(media_type):
+        return await item_builder(mass, media_content_id)
 
     raise BrowseError(f"Media not found: {media_content_type} / {media_content_id}")
 
 
-@callback
 async def build_main_listing(hass: HomeAssistant):
     """Build main browse listing."""
     parent_source = BrowseMedia(
@@ -113,19 +125,19 @@ async def build_main_listing(hass: HomeAssistant):
         title=DEFAULT_NAME,
         can_play=False,
         can_expand=True,
-        children=[],
+        children=[
+            BrowseMedia(
+                media_class=MEDIA_CLASS_DIRECTORY,
+                media_content_id=library,
+                media_content_type=DOMAIN,
+                title=LIBRARY_TITLE_MAP[library],
+                children_media_class=media_class,
+                can_play=False,
+                can_expand=True,
+            )
+            for library, media_class in LIBRARY_MEDIA_CLASS_MAP.items()
+        ],
     )
-    for library, media_class in LIBRARY_MEDIA_CLASS_MAP.items():
-        child_source = BrowseMedia(
-            media_class=MEDIA_CLASS_DIRECTORY,
-            media_content_id=library,
-            media_content_type=DOMAIN,
-            title=LIBRARY_TITLE_MAP[library],
-            children_media_class=media_class,
-            can_play=False,
-            can_expand=True,
-        )
-        parent_source.children.append(child_source)
 
     try:
         item = await media_source.async_browse_media(
@@ -141,23 +153,29 @@ async def build_main_listing(hass: HomeAssistant):
     return parent_source
 
 
-async def build_playlists_listing(mass: MusicAssistantClient):
-    """Build Playlists browse listing."""
-    media_class = LIBRARY_MEDIA_CLASS_MAP[LIBRARY_PLAYLISTS]
+async def build_library_listing(
+    mass: MusicAssistantClient, library: str
+) -> BrowseMedia:
+    """Build browse listing for one of the library folders."""
+    media_content_type, can_expand = LIBRARY_CONTENT_MAP[library]
+    media_class = LIBRARY_MEDIA_CLASS_MAP[library]
+    # radio is not accepted by HA as media class so we need to override it
+    item_media_class = media_class if library == LIBRARY_RADIO else None
+    items = await get_library_items(mass, library)
     return BrowseMedia(
         media_class=MEDIA_CLASS_DIRECTORY,
-        media_content_id=LIBRARY_PLAYLISTS,
-        media_content_type=MEDIA_TYPE_PLAYLIST,
-        title=LIBRARY_TITLE_MAP[LIBRARY_PLAYLISTS],
+        media_content_id=library,
+        media_content_type=media_content_type,
+        title=LIBRARY_TITLE_MAP[library],
         can_play=False,
         can_expand=True,
         children_media_class=media_class,
         children=sorted(
             [
-                build_item(mass, item, can_expand=True)
-                # we only grab the first page here because the
-                # HA media browser does not support paging
-                for item in await mass.music.get_library_playlists(limit=500)
+                build_item(
+                    mass, item, can_expand=can_expand, media_class=item_media_class
+                )
+                for item in items
                 if item.available
             ],
             key=lambda x: x.title,
@@ -165,9 +183,30 @@ async def build_playlists_listing(mass: MusicAssistantClient):
     )
 
 
+async def get_library_items(
+    mass: MusicAssistantClient, library: str
+) -> Sequence[MediaItemType]:
+    """Return the items of one of the library folders."""
+    # we only grab the first page here because the
+    # HA media browser does not support paging
+    if library == LIBRARY_ARTISTS:
+        return await mass.music.get_library_artists(limit=500)
+    if library == LIBRARY_ALBUMS:
+        return await mass.music.get_library_albums(limit=500)
+    if library == LIBRARY_TRACKS:
+        return await mass.music.get_library_tracks(limit=500)
+    if library == LIBRARY_PLAYLISTS:
+        return await mass.music.get_library_playlists(limit=500)
+    if library == LIBRARY_RADIO:
+        return await mass.music.get_library_radios(limit=500)
+    raise BrowseError(f"Library not found: {library}")
+
+
 async def build_playlist_items_listing(mass: MusicAssistantClient, identifier: str):
     """Build Playlist items browse listing."""
-    playlist = await mass.music.get_item_by_uri(identifier)
+    playlist, tracks = await get_item_with_children(
+        mass, identifier, mass.music.get_playlist_tracks
+    )
 
     return BrowseMedia(
         media_class=MEDIA_CLASS_PLAYLIST,
@@ -181,43 +220,17 @@ async def build_playlist_items_listing(mass: MusicAssistantClient, identifier: s
             build_item(mass, item, can_expand=False)
             # we only grab the first page here because the
             # HA media browser does not support paging
-            for item in await mass.music.get_playlist_tracks(
-                playlist.item_id, playlist.provider
-            )
+            for item in tracks
             if item.available
         ],
     )
 
 
-async def build_artists_listing(mass: MusicAssistantClient):
-    """Build Albums browse listing."""
-    media_class = LIBRARY_MEDIA_CLASS_MAP[LIBRARY_ARTISTS]
-
-    return BrowseMedia(
-        media_class=MEDIA_CLASS_DIRECTORY,
-        media_content_id=LIBRARY_ARTISTS,
-        media_content_type=MEDIA_TYPE_ARTIST,
-        title=LIBRARY_TITLE_MAP[LIBRARY_ARTISTS],
-        can_play=False,
-        can_expand=True,
-        children_media_class=media_class,
-        children=sorted(
-            [
-                build_item(mass, artist, can_expand=True)
-                # we only grab the first page here because the
-                # HA media browser does not support paging
-                for artist in await mass.music.get_library_artists(limit=500)
-                if artist.available
-            ],
-            key=lambda x: x.title,
-        ),
-    )
-
-
 async def build_artist_items_listing(mass: MusicAssistantClient, identifier: str):
     """Build Artist items browse listing."""
-    artist = await mass.music.get_item_by_uri(identifier)
-    albums = await mass.music.get_artist_albums(artist.item_id, artist.provider)
+    artist, albums = await get_item_with_children(
+        mass, identifier, mass.music.get_artist_albums
+    )
 
     return BrowseMedia(
         media_class=MEDIA_TYPE_ARTIST,
@@ -235,35 +248,11 @@ async def build_artist_items_listing(mass: MusicAssistantClient, identifier: str
     )
 
 
-async def build_albums_listing(mass: MusicAssistantClient):
-    """Build Albums browse listing."""
-    media_class = LIBRARY_MEDIA_CLASS_MAP[LIBRARY_ALBUMS]
-
-    return BrowseMedia(
-        media_class=MEDIA_CLASS_DIRECTORY,
-        media_content_id=LIBRARY_ALBUMS,
-        media_content_type=MEDIA_TYPE_ALBUM,
-        title=LIBRARY_TITLE_MAP[LIBRARY_ALBUMS],
-        can_play=False,
-        can_expand=True,
-        children_media_class=media_class,
-        children=sorted(
-            [
-                build_item(mass, album, can_expand=True)
-                # we only grab the first page here because the
-                # HA media browser does not support paging
-                for album in await mass.music.get_library_albums(limit=500)
-                if album.available
-            ],
-            key=lambda x: x.title,
-        ),
-    )
-
-
 async def build_album_items_listing(mass: MusicAssistantClient, identifier: str):
     """Build Album items browse listing."""
-    album = await mass.music.get_item_by_uri(identifier)
-    tracks = await mass.music.get_album_tracks(album.item_id, album.provider)
+    album, tracks = await get_item_with_children(
+        mass, identifier, mass.music.get_album_tracks
+    )
 
     return BrowseMedia(
         media_class=MEDIA_TYPE_ALBUM,
@@ -279,50 +268,11 @@ async def build_album_items_listing(mass: MusicAssistantClient, identifier: str)
     )
 
 
-async def build_tracks_listing(mass: MusicAssistantClient):
-    """Build Tracks browse listing."""
-    media_class = LIBRARY_MEDIA_CLASS_MAP[LIBRARY_TRACKS]
-
-    return BrowseMedia(
-        media_class=MEDIA_CLASS_DIRECTORY,
-        media_content_id=LIBRARY_ALBUMS,
-        media_content_type=MEDIA_TYPE_TRACK,
-        title=LIBRARY_TITLE_MAP[LIBRARY_TRACKS],
-        can_play=False,
-        can_expand=True,
-        children_media_class=media_class,
-        children=sorted(
-            [
-                build_item(mass, track, can_expand=False)
-                # we only grab the first page here because the
-                # HA media browser does not support paging
-                for track in await mass.music.get_library_tracks(limit=500)
-                if track.available
-            ],
-            key=lambda x: x.title,
-        ),
-    )
-
-
-async def build_radio_listing(mass: MusicAssistantClient):
-    """Build Radio browse listing."""
-    media_class = LIBRARY_MEDIA_CLASS_MAP[LIBRARY_RADIO]
-    return BrowseMedia(
-        media_class=MEDIA_CLASS_DIRECTORY,
-        media_content_id=LIBRARY_ALBUMS,
-        media_content_type=DOMAIN,
-        title=LIBRARY_TITLE_MAP[LIBRARY_RADIO],
-        can_play=False,
-        can_expand=True,
-        children_media_class=media_class,
-        children=[
-            build_item(mass, track, can_expand=False, media_class=media_class)
-            # we only grab the first page here because the
-            # HA media browser does not support paging
-            for track in await mass.music.get_library_radios(limit=500)
-            if track.available
-        ],
-    )
+ITEM_LISTING_BUILDERS = {
+    MEDIA_TYPE_ARTIST: build_artist_items_listing,
+    MEDIA_TYPE_ALBUM: build_album_items_listing,
+    MEDIA_TYPE_PLAYLIST: build_playlist_items_listing,
+}
 
 
 def build_item(
@@ -55,8 +55,6 @@ from music_assistant.common.models.enums import (
     RepeatMode,
 )
 from music_assistant.common.models.errors import MediaNotFoundError, MusicAssistantError
-from music_assistant.common.models.event import MassEvent
-from music_assistant.common.models.media_items import MediaItemType
 
 from .const import (
     ATTR_ACTIVE_GROUP,
@@ -68,6 +66,7 @@ from .const import (
     ATTR_QUEUE_INDEX,
     ATTR_QUEUE_ITEMS,
     ATTR_STREAM_TITLE,
+    CONF_ASSIST_AUTO_EXPOSE_PLAYERS,
     DOMAIN,
 )
 from .entity import MassBaseEntity
@@ -76,6 +75,8 @@ from .media_browser import async_browse_media
 
 if TYPE_CHECKING:
     from music_assistant.client import MusicAssistantClient
+    from music_assistant.common.models.event import MassEvent
+    from music_assistant.common.models.media_items import MediaItemType
     from music_assistant.common.models.player import Player
     from music_assistant.common.models.player_queue import PlayerQueue
 
@@ -104,14 +105,6 @@ STATE_MAPPING = {
     PlayerState.PAUSED: STATE_PAUSED,
 }
 
-QUEUE_OPTION_MAP = {
-    # map from HA enqueue options to MA enqueue options
-    # which are the same but just in case
-    MediaPlayerEnqueue.ADD: QueueOption.ADD,
-    MediaPlayerEnqueue.NEXT: QueueOption.NEXT,
-    MediaPlayerEnqueue.PLAY: QueueOption.PLAY,
-    MediaPlayerEnqueue.REPLACE: QueueOption.REPLACE,
-}
 
 SERVICE_PLAY_MEDIA_ADVANCED = "play_media"
 SERVICE_PLAY_ANNOUNCEMEMT = "play_announcement"
@@ -124,6 +117,9 @@ ATTR_URL = "url"
 ATTR_USE_PRE_ANNOUNCE = "use_pre_announce"
 ATTR_ANNOUNCE_VOLUME = "announce_volume"
 
+# max number of media_id lookups sent to the server at the same time
+MAX_CONCURRENT_LOOKUPS = 3
+
 # pylint: disable=too-many-public-methods
 
 _MassPlayerT = TypeVar("_MassPlayerT", bound="MassPlayer")
@@ -165,14 +161,23 @@ async def async_setup_entry(
         added_ids.add(event.object_id)
         async_add_entities([MassPlayer(mass, event.object_id)])
 
-    # register listener for new players
+    async def handle_player_removed(event: MassEvent) -> None:
+        """Handle Mass Player Removed event."""
+        # the device (and thus entity) is removed on the integration level,
+        # forget the id so the player gets a new entity if it comes back
+        added_ids.discard(event.object_id)
+
+    # register listeners for new and removed players
     config_entry.async_on_unload(
         mass.subscribe(handle_player_added, EventType.PLAYER_ADDED)
     )
+    config_entry.async_on_unload(
+        mass.subscribe(handle_player_removed, EventType.PLAYER_REMOVED)
+    )
     # add all current players
-    for player in mass.players:
-        added_ids.add(player.player_id)
-        async_add_entities([MassPlayer(mass, player.player_id)])
+    player_ids = [player.player_id for player in mass.players]
+    added_ids.update(player_ids)
+    async_add_entities([MassPlayer(mass, player_id) for player_id in player_ids])
 
     # add platform service for play_media with advanced options
     platform = async_get_current_platform()
@@ -210,16 +215,17 @@ class MassPlayer(MassBaseEntity, MediaPlayerEntity):
     # pylint: disable=abstract-method,too-many-instance-attributes
 
     _attr_name = None
+    _attr_device_class = MediaPlayerDeviceClass.SPEAKER
+    _attr_supported_features = SUPPORTED_FEATURES
 
     def __init__(self, mass: MusicAssistantClient, player_id: str) -> None:
         """Initialize MediaPlayer entity."""
         super().__init__(mass, player_id)
-        self._attr_icon = self.player.icon.replace("mdi-", "mdi:")
+        player = self.player
+        self._attr_icon = player.icon.replace("mdi-", "mdi:")
         self._attr_media_image_remotely_accessible = True
-        self._attr_supported_features = SUPPORTED_FEATURES
-        if PlayerFeature.SYNC in self.player.supported_features:
+        if PlayerFeature.SYNC in player.supported_features:
             self._attr_supported_features |= MediaPlayerEntityFeature.GROUPING
-        self._attr_device_class = MediaPlayerDeviceClass.SPEAKER
         self._attr_media_position_updated_at = None
         self._attr_media_position = None
         self._attr_media_duration = None
@@ -296,13 +302,13 @@ class MassPlayer(MassBaseEntity, MediaPlayerEntity):
         """Handle player updates."""
         # ruff: noqa: PLR0915
         # pylint: disable=too-many-statements
-        if not self.available:
-            return
         player = self.player
+        if not self._is_player_available(player):
+            return
         queue = self.mass.player_queues.get(player.active_source)
         # update generic attributes
         if player.powered:
-            self._attr_state = STATE_MAPPING[self.player.state]
+            self._attr_state = STATE_MAPPING[player.state]
         else:
             self._attr_state = STATE_OFF
         self._attr_group_members = player.group_childs
@@ -469,30 +475,8 @@ class MassPlayer(MassBaseEntity, MediaPlayerEntity):
     ) -> None:
         """Send the play_media command to the media player."""
         # pylint: disable=too-many-arguments
-        media_uris: list[str] = []
         # work out (all) uri(s) to play
-        for media_id_str in media_id:
-            # URL or URI string
-            if "://" in media_id_str:
-                media_uris.append(media_id_str)
-                continue
-            # try content id as library id
-            if media_type and media_id_str.isnumeric():
-                with suppress(MediaNotFoundError):
-                    item = await self.mass.music.get_item(
-                        media_type, media_id_str, "library"
-                    )
-                    media_uris.append(item.uri)
-                    continue
-            # try local accessible filename
-            elif await asyncio.to_thread(os.path.isfile, media_id_str):
-                media_uris.append(media_id_str)
-                continue
-            # last resort: lookup by name/search
-            if item := await self._get_item_by_name(
-                media_id_str, artist, album, media_type
-            ):
-                media_uris.append(item.uri)
+        media_uris = await self._resolve_media_uris(media_id, artist, album, media_type)
 
         if not media_uris:
             raise MediaNotFoundError(
@@ -521,6 +505,60 @@ class MassPlayer(MassBaseEntity, MediaPlayerEntity):
             self.player_id, url, use_pre_announce, announce_volume
         )
 
+    async def _resolve_media_uris(
+        self,
+        media_id: list[str],
+        artist: str | None = None,
+        album: str | None = None,
+        media_type: str | None = None,
+    ) -> list[str]:
+        """Resolve all media_ids to playable uris, skipping those not found."""
+        # resolve them concurrently because each lookup may require a roundtrip
+        # to the server but limit the number of lookups in flight
+        lookup_limit = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+
+        async def resolve_media_uri(media_id_str: str) -> str | None:
+            async with lookup_limit:
+                return await self._resolve_media_uri(
+                    media_id_str, artist, album, media_type
+                )
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [
+                    task_group.create_task(resolve_media_uri(media_id_str))
+                    for media_id_str in media_id
+                ]
+        except ExceptionGroup as err:
+            # the task group cancelled the pending lookups, raise the original
+            # error so it is handled like the error of any other command
+            raise err.exceptions[0] from None
+        return [uri for task in tasks if (uri := task.result())]
+
+    async def _resolve_media_uri(
+        self,
+        media_id: str,
+        artist: str | None = None,
+        album: str | None = None,
+        media_type: str | None = None,
+    ) -> str | None:
+        """Resolve a single media_id to a playable uri."""
+        # URL or URI string
+        if "://" in media_id:
+            return media_id
+        # try content id as library id
+        if media_type and media_id.isnumeric():
+            with suppress(MediaNotFoundError):
+                item = await self.mass.music.get_item(media_type, media_id, "library")
+                return item.uri
+        # try local accessible filename
+        elif await asyncio.to_thread(os.path.isfile, media_id):
+            return media_id
+        # last resort: lookup by name/search
+        if item := await self._get_item_by_name(media_id, artist, album, media_type):
+            return item.uri
+        return None
+
     async def async_browse_media(
         self, media_content_type=None, media_content_id=None
     ) -> BrowseMedia:
@@ -694,12 +732,11 @@ class MassPlayer(MassBaseEntity, MediaPlayerEntity):
                 )
 
     async def _expose_players_assist(self) -> None:
-        """Get the correct config entry."""
-        hass = self.hass
-        config_entries = hass.config_entries.async_entries(DOMAIN)
-        for config_entry in config_entries:
-            if (
-                config_entry.state == ConfigEntryState.SETUP_IN_PROGRESS
-                and config_entry.data.get("expose_players_assist")
-            ):
-                async_expose_entity(hass, "conversation", self.entity_id, True)
+        """Expose the player to Assist if enabled on our config entry."""
+        config_entry = self.platform.config_entry
+        if (
+            config_entry is not None
+            and config_entry.state == ConfigEntryState.SETUP_IN_PROGRESS
+            and config_entry.data.get(CONF_ASSIST_AUTO_EXPOSE_PLAYERS)
+        ):
+            async_expose_entity(self.hass, "conversation", self.entity_id, True)
@@ -0,0 +1,56 @@
+"""Tests for the Music Assistant base entity."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from music_assistant.common.models.enums import EventType
+from music_assistant.common.models.event import MassEvent
+
+from custom_components.mass.entity import MassBaseEntity
+
+
+async def create_entity(active_source="player_1"):
+    """Create a MassBaseEntity and return it with its mass update callback."""
+    mass = MagicMock()
+    mass.server_url = "http://localhost:8095"
+    player = mass.players.get.return_value
+    player.active_source = active_source
+    entity = MassBaseEntity(mass, "player_1")
+    entity.async_on_update = AsyncMock()
+    entity.async_write_ha_state = MagicMock()
+    await entity.async_added_to_hass()
+    # the same callback is subscribed to player and queue updates
+    on_mass_update = mass.subscribe.call_args.args[0]
+    entity.async_on_update.reset_mock()
+    return entity, on_mass_update
+
+
+async def test_queue_update_of_other_queue_is_ignored():
+    """Test updates of a queue that is not the active source are ignored."""
+    entity, on_mass_update = await create_entity(active_source="player_1")
+
+    await on_mass_update(MassEvent(event=EventType.QUEUE_UPDATED, object_id="player_2"))
+
+    entity.async_on_update.assert_not_awaited()
+    entity.async_write_ha_state.assert_not_called()
+
+
+async def test_queue_update_of_active_queue_updates_state():
+    """Test updates of the active queue update the entity state."""
+    entity, on_mass_update = await create_entity(active_source="player_1")
+
+    await on_mass_update(MassEvent(event=EventType.QUEUE_UPDATED, object_id="player_1"))
+
+    entity.async_on_update.assert_awaited_once()
+    entity.async_write_ha_state.assert_called_once()
+
+
+async def test_player_update_updates_state():
+    """Test player updates are never filtered on the active queue."""
+    entity, on_mass_update = await create_entity(active_source="player_1")
+
+    await on_mass_update(
+        MassEvent(event=EventType.PLAYER_UPDATED, object_id="player_1")
+    )
+
+    entity.async_on_update.assert_awaited_once()
+    entity.async_write_ha_state.assert_called_once()
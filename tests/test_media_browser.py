@@ -0,0 +1,52 @@
+"""Tests for the Music Assistant media browser."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.components.media_player import BrowseError
+from homeassistant.components.media_player.const import (
+    MEDIA_CLASS_PLAYLIST,
+    MEDIA_TYPE_PLAYLIST,
+)
+
+from custom_components.mass.media_browser import async_browse_media
+
+
+def create_mass():
+    """Create a mocked Music Assistant client."""
+    mass = MagicMock()
+    mass.music.get_item_by_uri = AsyncMock()
+    mass.music.get_playlist_tracks = AsyncMock(return_value=[])
+    mass.music.get_album_tracks = AsyncMock(return_value=[])
+    mass.music.get_artist_albums = AsyncMock(return_value=[])
+    return mass
+
+
+async def test_browse_routes_on_media_type_of_uri():
+    """Test a playlist uri is routed to the playlist listing."""
+    mass = create_mass()
+    playlist = mass.music.get_item_by_uri.return_value
+    playlist.uri = "library://playlist/album_mix"
+    playlist.name = "Album mix"
+
+    result = await async_browse_media(
+        MagicMock(), mass, "library://playlist/album_mix", MEDIA_TYPE_PLAYLIST
+    )
+
+    assert result.media_class == MEDIA_CLASS_PLAYLIST
+    assert result.media_content_id == "library://playlist/album_mix"
+    mass.music.get_playlist_tracks.assert_awaited_once_with("album_mix", "library")
+    mass.music.get_album_tracks.assert_not_awaited()
+    mass.music.get_artist_albums.assert_not_awaited()
+
+
+async def test_browse_unknown_media_type_raises():
+    """Test browsing a uri of an unsupported media type raises BrowseError."""
+    mass = create_mass()
+
+    with pytest.raises(BrowseError):
+        await async_browse_media(
+            MagicMock(), mass, "library://track/album_mix", "track"
+        )
+
+    mass.music.get_item_by_uri.assert_not_awaited()
@@ -0,0 +1,51 @@
+"""Tests for the Music Assistant media_player platform."""
+
+from unittest.mock import MagicMock, call, patch
+
+from music_assistant.common.models.enums import EventType
+from music_assistant.common.models.event import MassEvent
+
+from custom_components.mass.media_player import async_setup_entry
+
+
+@patch("custom_components.mass.media_player.async_get_current_platform")
+@patch("custom_components.mass.media_player.MassPlayer")
+@patch("custom_components.mass.media_player.get_mass")
+async def test_removed_player_gets_new_entity_when_added_again(
+    m_get_mass, m_mass_player, m_platform
+):
+    """Test a removed player is added again as a new entity."""
+    mass = m_get_mass.return_value
+    mass.players = []
+    subscriptions = {}
+
+    def subscribe(callback, event_filter=None, id_filter=None) -> MagicMock:
+        subscriptions[event_filter] = callback
+        return MagicMock()
+
+    mass.subscribe.side_effect = subscribe
+    async_add_entities = MagicMock()
+    await async_setup_entry(MagicMock(), MagicMock(), async_add_entities)
+    handle_player_added = subscriptions[EventType.PLAYER_ADDED]
+    handle_player_removed = subscriptions[EventType.PLAYER_REMOVED]
+
+    await handle_player_added(
+        MassEvent(event=EventType.PLAYER_ADDED, object_id="player_1")
+    )
+    # a duplicate added event does not create a second entity
+    await handle_player_added(
+        MassEvent(event=EventType.PLAYER_ADDED, object_id="player_1")
+    )
+    assert m_mass_player.call_count == 1
+
+    await handle_player_removed(
+        MassEvent(event=EventType.PLAYER_REMOVED, object_id="player_1")
+    )
+    await handle_player_added(
+        MassEvent(event=EventType.PLAYER_ADDED, object_id="player_1")
+    )
+    assert m_mass_player.call_args_list == [
+        call(mass, "player_1"),
+        call(mass, "player_1"),
+    ]
+    async_add_entities.assert_called_with([m_mass_player.return_value])